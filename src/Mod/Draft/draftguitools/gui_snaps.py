@@ -33,264 +33,161 @@
 import math
 import FreeCAD
 import FreeCADGui as Gui
+from PySide import QtCore
 from PySide import QtGui
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 import draftguitools.gui_base as gui_base
 from draftutils.messages import _log
 from draftutils.translate import translate
-from draftguitools.gui_trackers import orthoTracker
 from pivy import coin
 
+# Coin key codes of the digits used for the ortho tracking numeric input
+_DIGIT_KEYS = frozenset(range(ord('0'), ord('9') + 1))
+
+
+def _snapper():
+    """Return the Snapper, or None if it has not been created yet."""
+    return getattr(Gui, "Snapper", None)
+
+
 class Draft_Snap_Base():
     """Base Class inherited by all Draft Snap commands."""
 
+    _resources_template = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Snap mode as used by the Snapper, e.g. "Midpoint" for Draft_Snap_Midpoint.
+        cls._snap_mode = cls.__name__[11:]
+
     def Activated(self, status=0):
         # _log("GuiCommand: {}".format(self.__class__.__name__))
 
-        if hasattr(Gui, "Snapper"):
-            Gui.Snapper.toggle_snap(self.__class__.__name__[11:], bool(status))
+        snapper = _snapper()
+        if snapper is not None:
+            snapper.toggle_snap(self._snap_mode, bool(status))
 
     def IsActive(self):
-        return hasattr(Gui, "Snapper") and Gui.Snapper.isEnabled("Lock")
+        snapper = _snapper()
+        return snapper is not None and snapper.isEnabled("Lock")
 
     def isChecked(self):
         """Return true if the given snap is active in Snapper."""
-        return hasattr(Gui, "Snapper") and self.__class__.__name__[11:] in Gui.Snapper.active_snaps
-
-
-class Draft_Snap_Lock(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Lock tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Lock",
-                "Accel":     "Shift+S",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Lock", "Snap lock"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Lock", "Enables or disables snapping globally."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-    def IsActive(self): return True
-
-
-Gui.addCommand("Draft_Snap_Lock", Draft_Snap_Lock())
-
-
-class Draft_Snap_Midpoint(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Midpoint tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Midpoint",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Midpoint", "Snap midpoint"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Midpoint", "Snaps to the midpoint of edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Midpoint", Draft_Snap_Midpoint())
-
-
-class Draft_Snap_Perpendicular(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Perpendicular tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Perpendicular",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Perpendicular", "Snap perpendicular"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Perpendicular", "Snaps to the perpendicular points on faces and edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Perpendicular", Draft_Snap_Perpendicular())
-
-
-class Draft_Snap_Grid(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Grid tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Grid",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Grid", "Snap grid"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Grid", "Snaps to the intersections of grid lines."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Grid", Draft_Snap_Grid())
-
-
-class Draft_Snap_Intersection(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Intersection tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Intersection",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Intersection", "Snap intersection"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Intersection", "Snaps to the intersection of two edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Intersection", Draft_Snap_Intersection())
-
-
-class Draft_Snap_Parallel(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Parallel tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Parallel",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Parallel", "Snap parallel"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Parallel", "Snaps to an imaginary line parallel to straight edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Parallel", Draft_Snap_Parallel())
-
-
-class Draft_Snap_Endpoint(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Endpoint tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Endpoint",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Endpoint", "Snap endpoint"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Endpoint", "Snaps to the endpoints of edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Endpoint", Draft_Snap_Endpoint())
-
-
-class Draft_Snap_Angle(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Angle tool."""
+        snapper = _snapper()
+        return snapper is not None and self._snap_mode in snapper.active_snaps
 
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Angle",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Angle", "Snap angle"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Angle", "Snaps to the special cardinal points on circular edges, at multiples of 30° and 45°."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Angle", Draft_Snap_Angle())
-
-
-class Draft_Snap_Center(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Center tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Center",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Center", "Snap center"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Center", "Snaps to the center point of faces and circular edges, and to the Placement point of Working Plane Proxies and Building Parts."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Center", Draft_Snap_Center())
-
-
-class Draft_Snap_Extension(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Extension tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Extension",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Extension", "Snap extension"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Extension", "Snaps to an imaginary line that extends beyond the endpoints of straight edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Extension", Draft_Snap_Extension())
-
-
-class Draft_Snap_Near(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Near tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Near",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Near", "Snap near"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Near", "Snaps to the nearest point on faces and edges."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Near", Draft_Snap_Near())
-
-
-class Draft_Snap_Ortho(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Ortho tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Ortho",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Ortho", "Snap ortho"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Ortho", "Snaps to imaginary lines that cross the previous point at multiples of 45°."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Ortho", Draft_Snap_Ortho())
-
-
-class Draft_Snap_Special(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Special tool."""
-
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Special",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Special", "Snap special"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Special", "Snaps to special points defined by the object."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
-
-
-Gui.addCommand("Draft_Snap_Special", Draft_Snap_Special())
-
-
-class Draft_Snap_Dimensions(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_Dimensions tool."""
+    def _get_static_resources(self):
+        return {"Pixmap":    self._pixmap,
+                "MenuText":  self._menu_text,
+                "ToolTip":   self._tooltip,
+                "CmdType":   "NoTransaction"}
 
     def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_Dimensions",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_Dimensions", "Snap dimensions"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_Dimensions", "Shows temporary X and Y dimensions."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
+        """Return the command resources, only the checked state is updated."""
+        cls = self.__class__
+        if cls.__dict__.get("_resources_template") is None:
+            cls._resources_template = self._get_static_resources()
+        resources = cls._resources_template
+        resources["Checkable"] = self.isChecked()
+        return resources
 
 
-Gui.addCommand("Draft_Snap_Dimensions", Draft_Snap_Dimensions())
+class Draft_Snap_Lock(Draft_Snap_Base):
+    """GuiCommand for the Draft_Snap_Lock tool."""
 
+    _pixmap = "Draft_Snap_Lock"
+    _menu_text = QT_TRANSLATE_NOOP("Draft_Snap_Lock", "Snap lock")
+    _tooltip = QT_TRANSLATE_NOOP("Draft_Snap_Lock", "Enables or disables snapping globally.")
 
-class Draft_Snap_WorkingPlane(Draft_Snap_Base):
-    """GuiCommand for the Draft_Snap_WorkingPlane tool."""
+    def _get_static_resources(self):
+        resources = super()._get_static_resources()
+        resources["Accel"] = "Shift+S"
+        return resources
 
-    def GetResources(self):
-        return {"Pixmap":    "Draft_Snap_WorkingPlane",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_Snap_WorkingPlane", "Snap working plane"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_Snap_WorkingPlane", "Projects snap points onto the current working plane."),
-                "CmdType":   "NoTransaction",
-                "Checkable": self.isChecked()}
+    def IsActive(self): return True
 
 
-Gui.addCommand("Draft_Snap_WorkingPlane", Draft_Snap_WorkingPlane())
+# Snap commands that only differ by their name and texts.
+# The icon of each command has the same name as the command.
+_SNAP_COMMANDS = [
+    ("Draft_Snap_Midpoint",
+     QT_TRANSLATE_NOOP("Draft_Snap_Midpoint", "Snap midpoint"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Midpoint", "Snaps to the midpoint of edges.")),
+    ("Draft_Snap_Perpendicular",
+     QT_TRANSLATE_NOOP("Draft_Snap_Perpendicular", "Snap perpendicular"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Perpendicular", "Snaps to the perpendicular points on faces and edges.")),
+    ("Draft_Snap_Grid",
+     QT_TRANSLATE_NOOP("Draft_Snap_Grid", "Snap grid"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Grid", "Snaps to the intersections of grid lines.")),
+    ("Draft_Snap_Intersection",
+     QT_TRANSLATE_NOOP("Draft_Snap_Intersection", "Snap intersection"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Intersection", "Snaps to the intersection of two edges.")),
+    ("Draft_Snap_Parallel",
+     QT_TRANSLATE_NOOP("Draft_Snap_Parallel", "Snap parallel"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Parallel", "Snaps to an imaginary line parallel to straight edges.")),
+    ("Draft_Snap_Endpoint",
+     QT_TRANSLATE_NOOP("Draft_Snap_Endpoint", "Snap endpoint"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Endpoint", "Snaps to the endpoints of edges.")),
+    ("Draft_Snap_Angle",
+     QT_TRANSLATE_NOOP("Draft_Snap_Angle", "Snap angle"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Angle", "Snaps to the special cardinal points on circular edges, at multiples of 30° and 45°.")),
+    ("Draft_Snap_Center",
+     QT_TRANSLATE_NOOP("Draft_Snap_Center", "Snap center"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Center", "Snaps to the center point of faces and circular edges, and to the Placement point of Working Plane Proxies and Building Parts.")),
+    ("Draft_Snap_Extension",
+     QT_TRANSLATE_NOOP("Draft_Snap_Extension", "Snap extension"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Extension", "Snaps to an imaginary line that extends beyond the endpoints of straight edges.")),
+    ("Draft_Snap_Near",
+     QT_TRANSLATE_NOOP("Draft_Snap_Near", "Snap near"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Near", "Snaps to the nearest point on faces and edges.")),
+    ("Draft_Snap_Ortho",
+     QT_TRANSLATE_NOOP("Draft_Snap_Ortho", "Snap ortho"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Ortho", "Snaps to imaginary lines that cross the previous point at multiples of 45°.")),
+    ("Draft_Snap_Special",
+     QT_TRANSLATE_NOOP("Draft_Snap_Special", "Snap special"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Special", "Snaps to special points defined by the object.")),
+    ("Draft_Snap_Dimensions",
+     QT_TRANSLATE_NOOP("Draft_Snap_Dimensions", "Snap dimensions"),
+     QT_TRANSLATE_NOOP("Draft_Snap_Dimensions", "Shows temporary X and Y dimensions.")),
+    ("Draft_Snap_WorkingPlane",
+     QT_TRANSLATE_NOOP("Draft_Snap_WorkingPlane", "Snap working plane"),
+     QT_TRANSLATE_NOOP("Draft_Snap_WorkingPlane", "Projects snap points onto the current working plane.")),
+]
+
+
+def _make_snap_command(name, menu_text, tooltip):
+    """Return a new Draft_Snap_Base subclass for the given snap command."""
+    return type(name, (Draft_Snap_Base,),
+                {"__doc__": "GuiCommand for the {} tool.".format(name),
+                 "__module__": __name__,
+                 "_pixmap": name,
+                 "_menu_text": menu_text,
+                 "_tooltip": tooltip})
+
+
+for _name, _menu_text, _tooltip in _SNAP_COMMANDS:
+    globals()[_name] = _make_snap_command(_name, _menu_text, _tooltip)
 
 
 class ShowSnapBar(Draft_Snap_Base):
     """GuiCommand for the Draft_ShowSnapBar tool."""
 
+    _pixmap = "Draft_Snap"
+    _menu_text = QT_TRANSLATE_NOOP("Draft_ShowSnapBar", "Show snap toolbar")
+    _tooltip = QT_TRANSLATE_NOOP("Draft_ShowSnapBar", "Shows the snap toolbar if it is hidden.")
+
     def GetResources(self):
-        return {"Pixmap":    "Draft_Snap",
-                "MenuText":  QT_TRANSLATE_NOOP("Draft_ShowSnapBar", "Show snap toolbar"),
-                "ToolTip":   QT_TRANSLATE_NOOP("Draft_ShowSnapBar", "Shows the snap toolbar if it is hidden."),
-                "CmdType":   "NoTransaction"}
+        return self._get_static_resources()
 
     def Activated(self):
         """Execute when the command is called."""
-        if hasattr(Gui, "Snapper"):
-            toolbar = Gui.Snapper.get_snap_toolbar()
+        snapper = _snapper()
+        if snapper is not None:
+            toolbar = snapper.get_snap_toolbar()
             if toolbar is not None:
                 toolbar.show()
 
-
-Gui.addCommand('Draft_ShowSnapBar', ShowSnapBar())
-
 class Draft_Snap_Ortho_Extension():
     """Extends orthogonal snap functionality."""
     
@@ -301,8 +198,9 @@ class Draft_Snap_Ortho_Extension():
         self.tracker = None
         self.last_cursor_pos = None
         self.dimension_display = None
-        self.keyboard_buffer = ""
+        self.keyboard_buffer = []  # characters typed so far
         self.keyboard_input_active = False
+        self._pending_update = False
         
     def activate(self):
         """Activate ortho tracking."""
@@ -377,29 +275,42 @@ class Draft_Snap_Ortho_Extension():
         event: coin.SoKeyboardEvent
             The keyboard event from the 3D view
         """
-        # Q key activates held point
-        if event.getKey() == ord('Q'):
-            if event.getState() == coin.SoKeyboardEvent.DOWN:
-                if self.last_cursor_pos:
-                    self.set_base_point(self.last_cursor_pos)
-                    
-        # Enter key for numeric input
-        elif event.getKey() == coin.SoKeyboardEvent.RETURN:
-            if self.keyboard_input_active:
-                try:
-                    dist = float(self.keyboard_buffer)
-                    self.set_distance(dist)
-                except ValueError:
-                    pass
-                self.keyboard_input_active = False
-                self.keyboard_buffer = ""
-                
-        # Numeric input
-        elif event.getKey() in range(ord('0'), ord('9')+1) or event.getKey() == ord('.'):
-            if not self.keyboard_input_active:
-                self.keyboard_input_active = True
-                self.keyboard_buffer = ""
-            self.keyboard_buffer += chr(event.getKey())
+        key = event.getKey()
+        if key in _DIGIT_KEYS:
+            self._numeric_input(event, key)
+            return
+        handler = self._KEY_HANDLERS.get(key)
+        if handler is not None:
+            handler(self, event, key)
+
+    def _hold_point(self, event, key):
+        """Q key activates held point."""
+        if event.getState() == coin.SoKeyboardEvent.DOWN:
+            if self.last_cursor_pos:
+                self.set_base_point(self.last_cursor_pos)
+
+    def _commit_input(self, event, key):
+        """Enter key validates the numeric input."""
+        if self.keyboard_input_active:
+            try:
+                dist = float("".join(self.keyboard_buffer))
+                self.set_distance(dist)
+            except ValueError:
+                pass
+            self.keyboard_input_active = False
+            self.keyboard_buffer = []
+
+    def _numeric_input(self, event, key):
+        """Digits and decimal point are added to the numeric input."""
+        if not self.keyboard_input_active:
+            self.keyboard_input_active = True
+            self.keyboard_buffer = []
+        self.keyboard_buffer.append(chr(key))
+
+    # Keys handled by keyboard_event, other than the digits
+    _KEY_HANDLERS = {ord('Q'): _hold_point,
+                     coin.SoKeyboardEvent.RETURN: _commit_input,
+                     ord('.'): _numeric_input}
 
     def mouse_event(self, event):
         """Handle mouse movement for ortho tracking.
@@ -413,31 +324,56 @@ class Draft_Snap_Ortho_Extension():
         view = Gui.ActiveDocument.ActiveView
         point = view.getPoint(pos)
         self.last_cursor_pos = point
-        
+        self._schedule_tracker_update()
+
+    def _schedule_tracker_update(self):
+        """Update the tracker once the pending events have been processed.
+
+        Bursts of mouse events are coalesced into a single tracker update.
+        """
+        if not self._pending_update:
+            self._pending_update = True
+            QtCore.QTimer.singleShot(0, self._update_tracker)
+
+    def _update_tracker(self):
+        """Update the tracker with the last known cursor position."""
+        self._pending_update = False
         if self.tracker:
-            self.tracker.update(point)
+            self.tracker.update(self.last_cursor_pos)
 
 class Draft_Ortho_Track(Draft_Snap_Base):
     """GuiCommand for the Draft_Ortho_Track tool."""
 
+    _menu_text = QT_TRANSLATE_NOOP("Draft_Ortho_Track", "Orthogonal tracking")
+    _tooltip = QT_TRANSLATE_NOOP("Draft_Ortho_Track", "Helps you draw orthogonal lines from the previous point")
+
     def GetResources(self):
         shortcut = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetString("Draft_Ortho_Tracking_Shortcut")
         return {"Pixmap": "Draft_Snap_Ortho",
                 "Accel": shortcut,
-                "MenuText": QT_TRANSLATE_NOOP("Draft_Ortho_Track", "Orthogonal tracking"),
-                "ToolTip": QT_TRANSLATE_NOOP("Draft_Ortho_Track", "Helps you draw orthogonal lines from the previous point"),
+                "MenuText": self._menu_text,
+                "ToolTip": self._tooltip,
                 "CmdType": "ForEdit"}
 
     def Activated(self):
-        if hasattr(Gui, "Snapper"):
-            if not hasattr(Gui.Snapper, "ortho_tracking"):
+        snapper = _snapper()
+        if snapper is not None:
+            if not hasattr(snapper, "ortho_tracking"):
                 from draftguitools.gui_tool_utils import init_ortho_tracking
                 init_ortho_tracking()
-            if Gui.Snapper.ortho_tracking.active:
+            if snapper.ortho_tracking.active:
                 disable_ortho_tracking()
             else:
                 enable_ortho_tracking()
 
-Gui.addCommand('Draft_Ortho_Track', Draft_Ortho_Track())
+
+# Register all the commands of this module in one go
+_COMMANDS = [("Draft_Snap_Lock", Draft_Snap_Lock)]
+_COMMANDS += [(_name, globals()[_name]) for _name, _, _ in _SNAP_COMMANDS]
+_COMMANDS += [("Draft_ShowSnapBar", ShowSnapBar),
+              ("Draft_Ortho_Track", Draft_Ortho_Track)]
+
+for _name, _command in _COMMANDS:
+    Gui.addCommand(_name, _command())
 
 ## @}
@@ -1612,15 +1612,44 @@ class orthoTracker(Tracker):
         self.sep.addChild(self.textpos)
         self.sep.addChild(self.text)
 
+        # Ortho directions, cached until the working plane changes
+        self._directions = None
+        self._directions_key = None
+        # Inputs of the last update, to skip redundant ones
+        self._last_inputs = None
+
         super().__init__(children=[self.sep])
         self.update()
 
+    def _get_ortho_directions(self, wp):
+        """Return the 4 ortho directions in the given working plane.
+
+        The directions are only recomputed if the working plane, or its
+        orientation, has changed since the last call.
+        """
+        key = (id(wp), tuple(wp.u), tuple(wp.v))
+        if key != self._directions_key:
+            self._directions = []
+            for angle in [0, 90, 180, 270]:
+                rad = math.radians(angle)
+                self._directions.append(wp.u * math.cos(rad) + wp.v * math.sin(rad))
+            self._directions_key = key
+        return self._directions
+
     def update(self, cursor_pos=None):
         """Update visual elements based on cursor position."""
         if not self.base:
             return
             
         wp = FreeCAD.DraftWorkingPlane
+        inputs = (tuple(self.base),
+                  tuple(cursor_pos) if cursor_pos else None,
+                  self.distance,
+                  tuple(wp.u),
+                  tuple(wp.v))
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
         points = []
         
         # Calculate ortho points in working plane
@@ -1635,9 +1664,7 @@ class orthoTracker(Tracker):
                 dist = (cursor_wp - self.base).Length
                 
             # Calculate 4 ortho points
-            for angle in [0, 90, 180, 270]:
-                rad = math.radians(angle)
-                vec = wp.u * math.cos(rad) + wp.v * math.sin(rad)
+            for vec in self._get_ortho_directions(wp):
                 point = self.base + vec * dist
                 points.append(point)
                 